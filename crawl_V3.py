@@ -1,13 +1,27 @@
 """Crawl OneFlare category pages and export business details."""
 
 import argparse
+import asyncio
+import fnmatch
+import hashlib
+import json
 import logging
+import operator
+import os
+import queue
 import re
+import threading
 import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
-from typing import Dict, Iterable, List
+from typing import AbstractSet, Any, Callable, Dict, Iterable, Iterator, List, Optional
 
-import pandas as pd
+import httpx
+import openpyxl
+import xlsxwriter
+from selectolax.lexbor import LexborHTMLParser
 from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
@@ -15,28 +29,90 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
-
-@dataclass
+try:
+    from playwright.async_api import Error as PlaywrightError
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    from playwright.async_api import async_playwright
+except ImportError:  # Playwright is only needed for --backend playwright.
+    async_playwright = None
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-AU,en;q=0.9",
+}
+DEFAULT_WORKERS = min(8, max(4, os.cpu_count() or 1))
+_DIGITS_RE = re.compile(r"\d[\d,]*")
+# Detail rows start with one of these labels, e.g. "Website: https://...".
+DETAIL_LABELS = ("Website:", "Address:")
+# Shared by create_chrome_driver and the browsers kept warm by driver_pool_server.py.
+CHROME_ARGUMENTS = (
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--blink-settings=imagesEnabled=false",
+)
+# The extractor only reads text nodes, so skip downloading and painting assets.
+BLOCKED_CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+}
+# Third-party analytics, ads, chat widgets, and heavy assets dropped at the network layer via CDP.
+BLOCKED_URL_PATTERNS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*.woff2",
+    "*.png",
+    "*.jpg",
+)
+# Collects every text field of a page rendered by the Playwright backend in one round-trip.
+RENDERED_FIELDS_JS = """
+([nameSelector, jobsSelector, detailSelector]) => {
+    const text = (selector) => {
+        const node = document.querySelector(selector);
+        return node ? node.innerText : null;
+    };
+    return {
+        name: text(nameSelector),
+        jobs: text(jobsSelector),
+        details: Array.from(document.querySelectorAll(detailSelector), (node) => node.innerText),
+    };
+}
+"""
+PLAYWRIGHT_BLOCKED_RESOURCES = frozenset({"image", "stylesheet", "font", "media"})
+
+
+@dataclass(slots=True)
 class CrawlerSettings:
     """Configuration for crawling a OneFlare category page."""
 
     category_url: str
-    preload_delay: float = 60.0
-    business_page_delay: float = 3.0
     output_file: str = "business_data.xlsx"
     wait_timeout: float = 15.0
-    business_links_xpath: str = "//section[4]//li/h3/a"
-    name_xpath: str = "//h1"
-    jobs_xpath: str = "//main/div/section[1]/section/section[1]/p"
-    phone_xpath: str = "//a[@data-tooltip-content='Click to show number']"
+    request_timeout: float = 10.0
+    max_workers: int = DEFAULT_WORKERS
+    business_links_css: str = "section:nth-of-type(4) li > h3 > a"
+    name_css: str = "h1"
+    jobs_css: str = "main > div > section:nth-of-type(1) > section > section:nth-of-type(1) > p"
+    phone_css: str = "a[data-tooltip-content='Click to show number']"
+    phone_link_css: str = "a[href^='tel:']"
     detail_css_selector: str = ".sc-906e671e-5.bQwqNJ"
 
     def __post_init__(self) -> None:
         if not self.category_url:
             raise ValueError("category_url must not be empty.")
+        if self.max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
 
 
-@dataclass
+@dataclass(slots=True)
 class BusinessRecord:
     """Structured representation of a business profile."""
 
@@ -52,93 +128,469 @@ class BusinessRecord:
         return asdict(self)
 
 
+# Column order for the workbook, computed once; attrgetter avoids asdict's deep copy per row.
+_FIELDS = tuple(BusinessRecord.__dataclass_fields__)
+_GETTER = operator.attrgetter(*_FIELDS)
+
+
+def _clean_text(value: Optional[str], default: str = "N/A") -> str:
+    text = (value or "").strip()
+    return text if text else default
+
+
+def _parse_jobs_completed(text: str) -> str:
+    if text == "N/A":
+        return text
+    match = _DIGITS_RE.search(text)
+    return match.group().replace(",", "") if match else "N/A"
+
+
+def _details_map(texts: Iterable[str]) -> Dict[str, str]:
+    """Map each detail row starting with one of ``DETAIL_LABELS`` to its value, keeping the first occurrence."""
+    details: Dict[str, str] = {}
+    for text in texts:
+        stripped = text.strip()
+        for label in DETAIL_LABELS:
+            if stripped.startswith(label):
+                details.setdefault(label, stripped[len(label):].strip())
+                break
+    return details
+
+
+def _record_from_rendered_fields(payload: Dict[str, Any], phone: str, url: str) -> BusinessRecord:
+    """Build a record from the dict returned by ``RENDERED_FIELDS_JS``."""
+    details = _details_map(text for text in payload.get("details") or [] if text)
+    return BusinessRecord(
+        business_name=_clean_text(payload.get("name")),
+        jobs_completed=_parse_jobs_completed(_clean_text(payload.get("jobs"))),
+        phone_number=phone,
+        website_url=details.get("Website:") or "N/A",
+        address=details.get("Address:") or "N/A",
+        url=url,
+    )
+
+
+def _is_scraped(record: BusinessRecord) -> bool:
+    """Whether ``record`` holds real data rather than the all-``N/A`` result of a failed page load."""
+    return record.business_name != "N/A"
+
+
+def _pending_links(links: Iterable[str], seen_urls: AbstractSet[str]) -> List[str]:
+    """Drop duplicate links and links already exported by a previous run."""
+    unique = list(dict.fromkeys(links))
+    pending = [url for url in unique if url not in seen_urls]
+    if len(pending) < len(unique):
+        logging.info("Skipping %d business links already exported.", len(unique) - len(pending))
+    return pending
+
+
+class RecordCache:
+    """On-disk JSON cache of scraped records, one file per URL SHA-1.
+
+    With ``reuse=False`` lookups always miss but records are still written,
+    so a full rebuild refreshes the cache instead of replaying it.
+    """
+
+    def __init__(self, directory: str, reuse: bool = True) -> None:
+        self.directory = directory
+        self.reuse = reuse
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, url: str) -> Optional[BusinessRecord]:
+        """Return the cached record for ``url``, if any."""
+        if not self.reuse:
+            return None
+        try:
+            with open(self._path(url), encoding="utf-8") as handle:
+                record = BusinessRecord(**json.load(handle))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError):
+            logging.warning("Ignoring unreadable cache entry for %s.", url)
+            return None
+        except OSError as exc:
+            logging.warning("Could not read cache entry for %s (%s); scraping it again.", url, exc)
+            return None
+        return record if _is_scraped(record) else None
+
+    def put(self, record: BusinessRecord) -> None:
+        """Store ``record``; the write is atomic so concurrent workers never see partial files.
+
+        Write failures are logged and swallowed, since the record itself is still good.
+        """
+        path = self._path(record.url)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                json.dump(record.to_dict(), handle, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except OSError as exc:
+            logging.warning("Could not cache record for %s: %s", record.url, exc)
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+
+class SessionFetcher:
+    """Persistent HTTP/2 client used to download static business pages.
+
+    Requests to the same host are multiplexed over one keep-alive TLS
+    connection, and the client is shared by every worker thread.
+    """
+
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(self, timeout: float = 10.0, retries: int = 3, backoff_factor: float = 0.5) -> None:
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.client = httpx.Client(
+            http2=True,
+            headers=DEFAULT_HEADERS,
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=30),
+        )
+
+    def get_tree(self, url: str) -> LexborHTMLParser:
+        """Download ``url`` and return its parsed HTML tree."""
+        attempt = 0
+        while True:
+            try:
+                response = self.client.get(url)
+                if response.status_code not in self.RETRY_STATUSES or attempt >= self.retries:
+                    response.raise_for_status()
+                    return LexborHTMLParser(response.text)
+            except httpx.TransportError:
+                if attempt >= self.retries:
+                    raise
+            time.sleep(self.backoff_factor * 2**attempt)
+            attempt += 1
+
+    def close(self) -> None:
+        """Release pooled connections."""
+        self.client.close()
+
+
+class BrowserPool:
+    """Thread-safe pool of WebDrivers shared by crawler workers.
+
+    Drivers are created on first demand, up to ``size``, so crawls that never
+    leave the HTTP path do not pay for launching Chrome.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], WebDriver],
+        size: int,
+        dispose: Optional[Callable[[WebDriver], None]] = None,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1.")
+        self._factory = factory
+        self._size = size
+        self._dispose = dispose or (lambda driver: driver.quit())
+        self._idle: "queue.Queue[WebDriver]" = queue.Queue()
+        self._drivers: List[WebDriver] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> WebDriver:
+        """Return an idle driver, creating one while the pool is below capacity."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._drivers) < self._size:
+                driver = self._factory()
+                # The crawler relies on explicit waits only; an implicit wait would
+                # stall every WebDriverWait poll and best-effort lookup miss.
+                driver.implicitly_wait(0)
+                self._drivers.append(driver)
+                return driver
+        return self._idle.get()
+
+    def release(self, driver: WebDriver) -> None:
+        """Hand a driver back to the pool."""
+        self._idle.put(driver)
+
+    @contextmanager
+    def driver(self) -> Iterator[WebDriver]:
+        """Borrow a driver for the duration of a ``with`` block."""
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self) -> None:
+        """Dispose of every driver created by the pool (quitting them by default)."""
+        with self._lock:
+            for driver in self._drivers:
+                try:
+                    self._dispose(driver)
+                except (WebDriverException, OSError):
+                    logging.debug("Driver was not disposed cleanly.", exc_info=True)
+            self._drivers.clear()
+
+
+class DriverPoolClient:
+    """Leases warm Chrome instances from ``driver_pool_server.py``.
+
+    Each lease is a DevTools address of an already running browser; a local
+    chromedriver attaches to it, so releasing stops only chromedriver and the
+    browser stays up for the next job.
+    """
+
+    def __init__(self, pool_url: str, timeout: float = 60.0, block_trackers: bool = True) -> None:
+        self.pool_url = pool_url.rstrip("/")
+        self.timeout = timeout
+        self.block_trackers = block_trackers
+        self._leases: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self) -> WebDriver:
+        """Lease a browser from the pool server and attach a WebDriver to it."""
+        address = self._post("/acquire")["address"]
+        options = webdriver.ChromeOptions()
+        options.debugger_address = address
+        options.page_load_strategy = "none"
+        try:
+            driver = webdriver.Chrome(options=options)
+        except WebDriverException:
+            self._post("/release", {"address": address})
+            raise
+        if self.block_trackers:
+            block_tracker_urls(driver)
+        with self._lock:
+            self._leases[driver.session_id] = address
+        return driver
+
+    def release(self, driver: WebDriver) -> None:
+        """Reset the browser, detach chromedriver, and hand the browser back."""
+        with self._lock:
+            address = self._leases.pop(driver.session_id, None)
+        try:
+            # delete_all_cookies() only covers the current document's domain; CDP clears every cookie.
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.get("about:blank")
+        except WebDriverException:
+            logging.debug("Could not reset pooled browser %s.", address, exc_info=True)
+        # quit() would close the browser's windows; stopping the service only detaches.
+        driver.service.stop()
+        if address is not None:
+            self._post("/release", {"address": address})
+
+    def capacity(self) -> int:
+        """Number of browsers the pool server keeps warm."""
+        with urllib.request.urlopen(self.pool_url + "/status", timeout=self.timeout) as response:
+            return int(json.load(response)["size"])
+
+    def _post(self, path: str, payload: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        request = urllib.request.Request(
+            self.pool_url + path,
+            data=json.dumps(payload or {}).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            body = response.read()
+        return json.loads(body) if body else {}
+
+
 class OneFlareCrawler:
     """Class-based crawler responsible for harvesting business data from OneFlare."""
 
-    def __init__(self, driver: WebDriver, settings: CrawlerSettings) -> None:
-        self.driver = driver
+    def __init__(
+        self,
+        pool: BrowserPool,
+        settings: CrawlerSettings,
+        fetcher: Optional[SessionFetcher] = None,
+        cache: Optional[RecordCache] = None,
+        seen_urls: AbstractSet[str] = frozenset(),
+    ) -> None:
+        self.pool = pool
         self.settings = settings
-        self.wait = WebDriverWait(driver, settings.wait_timeout)
+        self.fetcher = fetcher or SessionFetcher(timeout=settings.request_timeout)
+        self.cache = cache
+        self.seen_urls = seen_urls
+        self._records: Dict[str, BusinessRecord] = {}
+        self._records_lock = threading.Lock()
 
     def run(self) -> List[BusinessRecord]:
         """Execute the crawl and return a collection of business records."""
-        self._load_category_page()
-        links = self._collect_business_links()
+        with self.pool.driver() as driver:
+            self._load_category_page(driver)
+            links = self._collect_business_links(driver)
         logging.info("Found %d business links.", len(links))
+        links = _pending_links(links, self.seen_urls)
         records: List[BusinessRecord] = []
-        for url in links:
-            try:
-                record = self._extract_business_data(url)
-                records.append(record)
-            except Exception as exc:
-                logging.exception("Failed to process %s: %s", url, exc)
+        with ThreadPoolExecutor(max_workers=self.settings.max_workers) as executor:
+            futures = [(url, executor.submit(self._scrape_one, url)) for url in links]
+            for url, future in futures:
+                try:
+                    records.append(future.result())
+                except Exception as exc:
+                    logging.exception("Failed to process %s: %s", url, exc)
         return records
 
-    def _load_category_page(self) -> None:
-        logging.info("Loading category page %s", self.settings.category_url)
-        self.driver.get(self.settings.category_url)
-        if self.settings.preload_delay > 0:
-            logging.debug("Waiting %.1f seconds for category page assets.", self.settings.preload_delay)
-            time.sleep(self.settings.preload_delay)
+    def _scrape_one(self, url: str) -> BusinessRecord:
+        if self.cache is not None:
+            cached = self.cache.get(url)
+            if cached is not None:
+                logging.debug("Using cached record for %s", url)
+                return cached
+        record = self._extract_business_data(url)
+        if self.cache is not None and _is_scraped(record):
+            self.cache.put(record)
+        return record
+
+    def _wait(self, driver: WebDriver) -> WebDriverWait:
+        return WebDriverWait(driver, self.settings.wait_timeout)
+
+    def _navigate(self, driver: WebDriver, url: str) -> None:
+        """Start loading ``url`` and wait until the new document is at least interactive.
+
+        With ``page_load_strategy="none"`` ``driver.get`` returns before navigation
+        commits, so the previous document must go stale first; otherwise its
+        readyState and elements would be mistaken for the new page's.
+        """
+        try:
+            previous = driver.find_element(By.TAG_NAME, "html")
+        except NoSuchElementException:
+            previous = None
+        driver.get(url)
+        wait = self._wait(driver)
+        try:
+            if previous is not None:
+                wait.until(EC.staleness_of(previous))
+            wait.until(lambda d: d.execute_script("return document.readyState") in ("interactive", "complete"))
+        except TimeoutException:
+            logging.debug("Document for %s did not become interactive in time.", url)
 
-    def _collect_business_links(self) -> List[str]:
+    def _load_category_page(self, driver: WebDriver) -> None:
+        logging.info("Loading category page %s", self.settings.category_url)
+        self._navigate(driver, self.settings.category_url)
         try:
-            self.wait.until(EC.presence_of_all_elements_located((By.XPATH, self.settings.business_links_xpath)))
+            self._wait(driver).until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, self.settings.business_links_css))
+            )
         except TimeoutException:
             logging.warning("Timeout while waiting for business links.")
-        links = self.driver.find_elements(By.XPATH, self.settings.business_links_xpath)
-        hrefs: List[str] = []
-        for link in links:
-            href = link.get_attribute("href")
-            if href:
-                hrefs.append(href)
-        return hrefs
+
+    def _collect_business_links(self, driver: WebDriver) -> List[str]:
+        hrefs = driver.execute_script(
+            "return Array.from(document.querySelectorAll(arguments[0]), (a) => a.href).filter(Boolean);",
+            self.settings.business_links_css,
+        )
+        return list(dict.fromkeys(hrefs or []))
 
     def _extract_business_data(self, url: str) -> BusinessRecord:
+        """Scrape ``url``, guarding against the same URL being scraped twice in one crawl."""
+        with self._records_lock:
+            if url in self._records:
+                return self._records[url]
+        record = self._scrape_business_page(url)
+        if not _is_scraped(record):
+            return record
+        with self._records_lock:
+            return self._records.setdefault(url, record)
+
+    def _scrape_business_page(self, url: str) -> BusinessRecord:
         logging.info("Scraping business details from %s", url)
-        self.driver.get(url)
-        try:
-            self.wait.until(EC.presence_of_element_located((By.XPATH, self.settings.name_xpath)))
-        except TimeoutException:
-            logging.warning("Business name field did not load for %s.", url)
-        if self.settings.business_page_delay > 0:
-            logging.debug("Waiting %.1f seconds for business page details.", self.settings.business_page_delay)
-            time.sleep(self.settings.business_page_delay)
-        name = self._safe_get_text(By.XPATH, self.settings.name_xpath)
-        jobs = self._extract_jobs_completed()
-        phone = self._extract_phone_number()
-        website = self._extract_detail_by_label("Website:")
-        address = self._extract_detail_by_label("Address:")
+        tree = self._fetch_tree(url)
+        if tree is None:
+            with self.pool.driver() as driver:
+                return self._extract_rendered_business_data(driver, url)
+        phone = self._extract_phone_number(tree)
+        # Only open a browser when there is a reveal button to click; profiles
+        # without one would otherwise wait out the full timeout for nothing.
+        if phone == "N/A" and tree.css_first(self.settings.phone_css) is not None:
+            logging.debug("Phone number not present in static HTML for %s; revealing it with Selenium.", url)
+            with self.pool.driver() as driver:
+                self._load_business_page(driver, url, self.settings.phone_css)
+                phone = self._click_phone_number(driver)
+        return self._record_from_tree(tree, phone, url)
+
+    def _record_from_tree(self, tree: LexborHTMLParser, phone: str, url: str) -> BusinessRecord:
+        details = self._load_details_map(tree)
         return BusinessRecord(
-            business_name=name,
-            jobs_completed=jobs,
+            business_name=self._safe_get_text(tree, self.settings.name_css),
+            jobs_completed=self._extract_jobs_completed(tree),
             phone_number=phone,
-            website_url=website,
-            address=address,
+            website_url=details.get("Website:") or "N/A",
+            address=details.get("Address:") or "N/A",
             url=url,
         )
 
-    def _safe_get_text(self, by: str, locator: str, default: str = "N/A") -> str:
+    def _fetch_tree(self, url: str) -> Optional[LexborHTMLParser]:
+        """Fetch the static HTML for ``url``, or return ``None`` when it must be rendered."""
         try:
-            element = self.driver.find_element(by, locator)
-            text = element.text.strip()
-            return text if text else default
-        except NoSuchElementException:
+            tree = self.fetcher.get_tree(url)
+        except httpx.HTTPError as exc:
+            logging.warning("HTTP fetch failed for %s (%s); falling back to Selenium.", url, exc)
+            return None
+        if tree.css_first(self.settings.name_css) is None:
+            logging.debug("Static HTML for %s has no business name; falling back to Selenium.", url)
+            return None
+        return tree
+
+    @staticmethod
+    def _safe_get_text(tree: LexborHTMLParser, selector: str, default: str = "N/A") -> str:
+        node = tree.css_first(selector)
+        if node is None:
             return default
+        text = node.text(separator=" ", strip=True)
+        return text if text else default
+
+    def _extract_jobs_completed(self, tree: LexborHTMLParser) -> str:
+        return _parse_jobs_completed(self._safe_get_text(tree, self.settings.jobs_css))
 
-    def _extract_jobs_completed(self) -> str:
-        text = self._safe_get_text(By.XPATH, self.settings.jobs_xpath)
-        if text == "N/A":
-            return text
-        match = re.search(r"\d+", text.replace(",", ""))
-        return match.group() if match else "N/A"
+    def _extract_phone_number(self, tree: LexborHTMLParser) -> str:
+        node = tree.css_first(self.settings.phone_link_css)
+        if node is None:
+            return "N/A"
+        number = (node.attributes.get("href") or "")[len("tel:"):].strip()
+        return number if number else "N/A"
+
+    def _load_details_map(self, tree: LexborHTMLParser) -> Dict[str, str]:
+        return _details_map(node.text(separator=" ", strip=True) for node in tree.css(self.settings.detail_css_selector))
+
+    def _extract_rendered_business_data(self, driver: WebDriver, url: str) -> BusinessRecord:
+        self._load_business_page(driver, url, self.settings.detail_css_selector)
+        # One page_source read; every field is then parsed locally without further WebDriver calls.
+        tree = LexborHTMLParser(driver.page_source)
+        phone = self._extract_phone_number(tree)
+        if phone == "N/A":
+            phone = self._click_phone_number(driver)
+        return self._record_from_tree(tree, phone, url)
+
+    def _load_business_page(self, driver: WebDriver, url: str, ready_css: str) -> None:
+        """Open ``url`` and wait for the business name and the ``ready_css`` element."""
+        self._navigate(driver, url)
+        wait = self._wait(driver)
+        try:
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, self.settings.name_css)))
+        except TimeoutException:
+            logging.warning("Business name field did not load for %s.", url)
+            return
+        try:
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ready_css)))
+        except TimeoutException:
+            logging.debug("Element %s did not load for %s.", ready_css, url)
 
-    def _extract_phone_number(self) -> str:
+    def _click_phone_number(self, driver: WebDriver) -> str:
         try:
-            phone_element = self.driver.find_element(By.XPATH, self.settings.phone_xpath)
+            phone_element = driver.find_element(By.CSS_SELECTOR, self.settings.phone_css)
+            original_text = phone_element.text.strip()
             try:
                 phone_element.click()
-                time.sleep(0.5)
+                WebDriverWait(driver, 3).until(lambda _: phone_element.text.strip() != original_text)
+            except TimeoutException:
+                logging.debug("Phone number was not revealed; returning visible text.")
             except Exception:
                 logging.debug("Phone element click failed; returning visible text.")
             text = phone_element.text.strip()
@@ -146,39 +598,210 @@ class OneFlareCrawler:
         except NoSuchElementException:
             return "N/A"
 
-    def _extract_detail_by_label(self, label: str) -> str:
-        elements = self.driver.find_elements(By.CSS_SELECTOR, self.settings.detail_css_selector)
-        for element in elements:
-            raw_text = element.text.strip()
-            if label in raw_text:
-                value = raw_text.split(label, 1)[1].strip()
-                return value if value else "N/A"
-        return "N/A"
+
+class PlaywrightCrawler:
+    """Async crawler that renders every profile in one Chromium with a context per worker."""
+
+    def __init__(
+        self,
+        settings: CrawlerSettings,
+        headless: bool = True,
+        block_trackers: bool = True,
+        cache: Optional[RecordCache] = None,
+        seen_urls: AbstractSet[str] = frozenset(),
+    ) -> None:
+        self.settings = settings
+        self.headless = headless
+        self.block_trackers = block_trackers
+        self.cache = cache
+        self.seen_urls = seen_urls
+        self.timeout_ms = settings.wait_timeout * 1000
+
+    def run(self) -> List[BusinessRecord]:
+        """Execute the crawl and return a collection of business records."""
+        if async_playwright is None:
+            raise RuntimeError("Playwright is not installed; run `pip install playwright && playwright install chromium`.")
+        return asyncio.run(self._run())
+
+    async def _run(self) -> List[BusinessRecord]:
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=self.headless, args=list(CHROME_ARGUMENTS))
+            try:
+                contexts: "asyncio.Queue[Any]" = asyncio.Queue()
+                for _ in range(self.settings.max_workers):
+                    contexts.put_nowait(await self._new_context(browser))
+                links = await self._collect_business_links(contexts)
+                logging.info("Found %d business links.", len(links))
+                links = _pending_links(links, self.seen_urls)
+                results = await asyncio.gather(
+                    *(self._scrape(contexts, url) for url in links),
+                    return_exceptions=True,
+                )
+            finally:
+                await browser.close()
+        records: List[BusinessRecord] = []
+        for url, result in zip(links, results):
+            if isinstance(result, BaseException):
+                logging.error("Failed to process %s: %s", url, result, exc_info=result)
+            else:
+                records.append(result)
+        return records
+
+    async def _new_context(self, browser: Any) -> Any:
+        context = await browser.new_context(user_agent=DEFAULT_HEADERS["User-Agent"])
+        if self.block_trackers:
+            await context.route("**/*", self._route_request)
+        return context
+
+    @staticmethod
+    async def _route_request(route: Any) -> None:
+        request = route.request
+        if request.resource_type in PLAYWRIGHT_BLOCKED_RESOURCES or any(
+            fnmatch.fnmatchcase(request.url, pattern) for pattern in BLOCKED_URL_PATTERNS
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _collect_business_links(self, contexts: "asyncio.Queue[Any]") -> List[str]:
+        logging.info("Loading category page %s", self.settings.category_url)
+        selector = self.settings.business_links_css
+        context = await contexts.get()
+        page = await context.new_page()
+        try:
+            await page.goto(self.settings.category_url, wait_until="domcontentloaded")
+            try:
+                await page.wait_for_selector(selector, timeout=self.timeout_ms)
+            except PlaywrightTimeoutError:
+                logging.warning("Timeout while waiting for business links.")
+            return await page.eval_on_selector_all(selector, "links => links.map(a => a.href).filter(Boolean)")
+        finally:
+            await page.close()
+            contexts.put_nowait(context)
+
+    async def _scrape(self, contexts: "asyncio.Queue[Any]", url: str) -> BusinessRecord:
+        if self.cache is not None:
+            cached = self.cache.get(url)
+            if cached is not None:
+                logging.debug("Using cached record for %s", url)
+                return cached
+        context = await contexts.get()
+        page = await context.new_page()
+        try:
+            record = await self._extract_business_data(page, url)
+        finally:
+            await page.close()
+            contexts.put_nowait(context)
+        if self.cache is not None and _is_scraped(record):
+            self.cache.put(record)
+        return record
+
+    async def _extract_business_data(self, page: Any, url: str) -> BusinessRecord:
+        logging.info("Scraping business details from %s", url)
+        await page.goto(url, wait_until="domcontentloaded")
+        try:
+            await page.wait_for_selector(self.settings.name_css, state="attached", timeout=self.timeout_ms)
+        except PlaywrightTimeoutError:
+            logging.warning("Business name field did not load for %s.", url)
+        payload = await page.evaluate(
+            RENDERED_FIELDS_JS,
+            [self.settings.name_css, self.settings.jobs_css, self.settings.detail_css_selector],
+        )
+        return _record_from_rendered_fields(payload or {}, await self._click_phone_number(page), url)
+
+    async def _click_phone_number(self, page: Any) -> str:
+        phone_element = await page.query_selector(self.settings.phone_css)
+        if phone_element is None:
+            return "N/A"
+        original_text = (await phone_element.inner_text()).strip()
+        try:
+            await phone_element.click()
+            await page.wait_for_function(
+                "([element, text]) => element.innerText.trim() !== text",
+                arg=[phone_element, original_text],
+                timeout=3000,
+            )
+        except PlaywrightTimeoutError:
+            logging.debug("Phone number was not revealed; returning visible text.")
+        except PlaywrightError:
+            logging.debug("Phone element click failed; returning visible text.")
+        return _clean_text(await phone_element.inner_text())
 
 
 class ExcelExporter:
     """Responsible for serializing business records to Excel."""
 
+    @staticmethod
+    def load(output_file: str) -> List[BusinessRecord]:
+        """Read records back from a workbook written by ``export``; missing files yield none."""
+        if not os.path.exists(output_file):
+            return []
+        workbook = openpyxl.load_workbook(output_file, read_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None) or ()
+            positions = {name: index for index, name in enumerate(header)}
+            if not all(column in positions for column in _FIELDS):
+                logging.warning("%s does not have the expected columns; ignoring it.", output_file)
+                return []
+            records: List[BusinessRecord] = []
+            for row in rows:
+                values = ["N/A" if row[positions[column]] is None else str(row[positions[column]]) for column in _FIELDS]
+                record = BusinessRecord(*values)
+                if record.url != "N/A":
+                    records.append(record)
+            return records
+        finally:
+            workbook.close()
+
     @staticmethod
     def export(records: Iterable[BusinessRecord], output_file: str) -> None:
-        rows = [record.to_dict() for record in records]
-        columns = list(BusinessRecord.__dataclass_fields__.keys())
-        df = pd.DataFrame(rows, columns=columns)
-        df.to_excel(output_file, index=False)
-        logging.info("Saved %d records to %s", len(rows), output_file)
+        # constant_memory flushes each row to disk as soon as the next one starts. Scraped
+        # values are written as plain strings: auto-converted URLs hit Excel's per-sheet
+        # hyperlink and length limits (which silently truncate rows), and "=..." text
+        # must never become a live formula.
+        workbook = xlsxwriter.Workbook(
+            output_file,
+            {"constant_memory": True, "strings_to_urls": False, "strings_to_formulas": False},
+        )
+        try:
+            worksheet = workbook.add_worksheet()
+            worksheet.write_row(0, 0, _FIELDS)
+            count = 0
+            for count, record in enumerate(records, start=1):
+                worksheet.write_row(count, 0, _GETTER(record))
+        finally:
+            workbook.close()
+        logging.info("Saved %d records to %s", count, output_file)
+
+
+def block_tracker_urls(driver: WebDriver) -> None:
+    """Block ``BLOCKED_URL_PATTERNS`` for every page loaded by ``driver``."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)})
+    except WebDriverException:
+        logging.debug("Unable to block tracker URLs; continuing without it.", exc_info=True)
 
 
-def create_chrome_driver(headless: bool = False) -> WebDriver:
-    """Build a Chrome WebDriver with optional headless mode."""
+def create_chrome_driver(headless: bool = True, block_trackers: bool = True) -> WebDriver:
+    """Build a Chrome WebDriver that skips images, stylesheets, fonts, and optionally trackers."""
     options = webdriver.ChromeOptions()
     if headless:
         options.add_argument("--headless=new")
     options.add_argument("--start-maximized")
+    for argument in CHROME_ARGUMENTS:
+        options.add_argument(argument)
+    options.add_experimental_option("prefs", BLOCKED_CONTENT_PREFS)
+    # driver.get returns immediately; the crawler polls readyState and waits for its own selectors.
+    options.page_load_strategy = "none"
     driver = webdriver.Chrome(options=options)
     try:
         driver.maximize_window()
     except WebDriverException:
         logging.debug("Unable to maximize window; continuing with default size.")
+    if block_trackers:
+        block_tracker_urls(driver)
     return driver
 
 
@@ -193,41 +816,115 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Crawl OneFlare business listings.")
     parser.add_argument("--category-url", default="https://www.oneflare.com.au/air-conditioning", help="OneFlare category URL to crawl.")
     parser.add_argument("--output", default="business_data.xlsx", help="Destination Excel file.")
-    parser.add_argument("--preload-delay", type=float, default=60.0, help="Seconds to wait after loading the category page.")
-    parser.add_argument("--business-page-delay", type=float, default=3.0, help="Seconds to wait after loading each business page.")
     parser.add_argument("--wait-timeout", type=float, default=15.0, help="Maximum seconds to wait for key elements.")
-    parser.add_argument("--headless", action="store_true", help="Run Chrome in headless mode.")
+    parser.add_argument("--request-timeout", type=float, default=10.0, help="HTTP timeout for fetching business pages.")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Number of business pages scraped concurrently.")
+    parser.add_argument(
+        "--headless",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Run Chrome in headless mode (use --no-headless to watch the browser).",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=("selenium", "playwright"),
+        default="selenium",
+        help="Browser automation backend; playwright renders every profile with async browser contexts.",
+    )
+    parser.add_argument(
+        "--block-trackers",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Block analytics, ad, and tracker requests through the DevTools protocol.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Skip URLs already present in the output workbook and reuse cached records (--no-incremental rescrapes everything).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=".cache",
+        help="Directory for per-URL JSON records reused across runs (empty string disables).",
+    )
+    parser.add_argument(
+        "--driver-pool",
+        metavar="URL",
+        help="Lease warm browsers from driver_pool_server.py at URL instead of launching Chrome.",
+    )
     parser.add_argument("--verbose", action="store_true", help="Enable debug logging.")
     return parser.parse_args()
 
 
+def run_selenium_crawl(
+    settings: CrawlerSettings,
+    args: argparse.Namespace,
+    cache: Optional[RecordCache],
+    seen_urls: AbstractSet[str],
+) -> List[BusinessRecord]:
+    """Crawl with OneFlareCrawler, using local or pooled Chrome instances."""
+
+    def driver_factory() -> WebDriver:
+        try:
+            return create_chrome_driver(headless=args.headless, block_trackers=args.block_trackers)
+        except WebDriverException as exc:
+            logging.exception("Could not initialize the Chrome WebDriver: %s", exc)
+            raise
+
+    if args.driver_pool:
+        client = DriverPoolClient(args.driver_pool, block_trackers=args.block_trackers)
+        # Leases return to the server only when the run ends, so never ask for more
+        # browsers than it has; extra workers wait for an idle driver instead.
+        size = min(settings.max_workers, client.capacity())
+        if size < settings.max_workers:
+            logging.info("Driver pool serves %d browsers; %d workers will share them.", size, settings.max_workers)
+        pool = BrowserPool(client.acquire, size=size, dispose=client.release)
+    else:
+        pool = BrowserPool(driver_factory, size=settings.max_workers)
+    fetcher = SessionFetcher(timeout=settings.request_timeout)
+    crawler = OneFlareCrawler(pool, settings, fetcher, cache=cache, seen_urls=seen_urls)
+    try:
+        return crawler.run()
+    finally:
+        fetcher.close()
+        pool.close()
+
+
 def main() -> None:
     """Entry point for running the crawler from the command line."""
     args = parse_args()
     configure_logging(args.verbose)
     settings = CrawlerSettings(
         category_url=args.category_url,
-        preload_delay=args.preload_delay,
-        business_page_delay=args.business_page_delay,
         output_file=args.output,
         wait_timeout=args.wait_timeout,
+        request_timeout=args.request_timeout,
+        max_workers=args.workers,
     )
-
-    try:
-        driver = create_chrome_driver(headless=args.headless)
-    except WebDriverException as exc:
-        logging.exception("Could not initialize the Chrome WebDriver: %s", exc)
-        raise
-
-    crawler = OneFlareCrawler(driver, settings)
-    try:
+    previous = ExcelExporter.load(settings.output_file) if args.incremental else []
+    # Rows from failed page loads are not "seen", so they are scraped again this run.
+    seen_urls = frozenset(record.url for record in previous if _is_scraped(record))
+    cache = RecordCache(args.cache_dir, reuse=args.incremental) if args.cache_dir else None
+    if args.backend == "playwright":
+        crawler = PlaywrightCrawler(
+            settings,
+            headless=args.headless,
+            block_trackers=args.block_trackers,
+            cache=cache,
+            seen_urls=seen_urls,
+        )
         records = crawler.run()
-    finally:
-        driver.quit()
-
-    ExcelExporter.export(records, settings.output_file)
-    if not records:
-        logging.warning("No business records collected. Inspect selectors or delays for adjustments.")
+    else:
+        records = run_selenium_crawl(settings, args, cache, seen_urls)
+
+    scraped_urls = {record.url for record in records}
+    kept = [record for record in previous if record.url in seen_urls or record.url not in scraped_urls]
+    ExcelExporter.export(kept + records, settings.output_file)
+    if not records and previous:
+        logging.info("No new business records since the previous run.")
+    elif not records:
+        logging.warning("No business records collected. Inspect selectors or wait timeouts for adjustments.")
 
 
 if __name__ == "__main__":
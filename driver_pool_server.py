@@ -0,0 +1,243 @@
+"""Keep headless Chrome browsers warm between crawler runs."""
+
+import argparse
+import json
+import logging
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Set
+
+from crawl_V3 import BLOCKED_CONTENT_PREFS, CHROME_ARGUMENTS, configure_logging
+
+CHROME_BINARIES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+DEVTOOLS_STARTUP_TIMEOUT = 20.0
+
+
+@dataclass
+class WarmBrowser:
+    """A Chrome process exposing the DevTools protocol on a fixed port."""
+
+    port: int
+    profile_dir: str
+    process: subprocess.Popen
+
+    @property
+    def address(self) -> str:
+        return f"127.0.0.1:{self.port}"
+
+    def wait_until_ready(self, timeout: float = DEVTOOLS_STARTUP_TIMEOUT) -> bool:
+        """Poll the DevTools endpoint until it answers; ``False`` if the process exits or time runs out."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and self.process.poll() is None:
+            try:
+                with urllib.request.urlopen(f"http://{self.address}/json/version", timeout=1):
+                    return True
+            except OSError:
+                time.sleep(0.2)
+        return False
+
+
+class DriverPool:
+    """Fixed-size set of running browsers handed out by DevTools address."""
+
+    def __init__(self, size: int, chrome_binary: str, base_port: int = 9300, headless: bool = True) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1.")
+        self.size = size
+        self.chrome_binary = chrome_binary
+        self.base_port = base_port
+        self.headless = headless
+        self._browsers: Dict[str, WarmBrowser] = {}
+        self._idle: "queue.Queue[str]" = queue.Queue()
+        self._leased: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Launch every browser and mark it idle."""
+        for index in range(self.size):
+            browser = self._launch(self.base_port + index)
+            self._browsers[browser.address] = browser
+        for browser in self._browsers.values():
+            if not browser.wait_until_ready():
+                raise RuntimeError(f"Browser on port {browser.port} did not open its DevTools port.")
+            self._idle.put(browser.address)
+        logging.info("Started %d warm browsers.", self.size)
+
+    def acquire(self, timeout: float) -> Optional[str]:
+        """Lease an idle browser, relaunching it first if its process has exited."""
+        try:
+            address = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        browser = self._browsers[address]
+        if browser.process.poll() is not None:
+            logging.warning("Browser on port %d exited; relaunching.", browser.port)
+            shutil.rmtree(browser.profile_dir, ignore_errors=True)
+            browser = self._browsers[address] = self._launch(browser.port)
+            if not browser.wait_until_ready():
+                # Leave the dead process in place so the next acquire relaunches it again.
+                logging.error("Relaunched browser on port %d is not responding.", browser.port)
+                browser.process.kill()
+                browser.process.wait()
+                self._idle.put(address)
+                return None
+        with self._lock:
+            self._leased.add(address)
+        return address
+
+    def release(self, address: str) -> bool:
+        """Return a leased browser to the idle queue."""
+        with self._lock:
+            if address not in self._leased:
+                return False
+            self._leased.discard(address)
+        self._idle.put(address)
+        return True
+
+    def close(self) -> None:
+        """Terminate every browser process."""
+        for browser in self._browsers.values():
+            browser.process.terminate()
+        for browser in self._browsers.values():
+            try:
+                browser.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                browser.process.kill()
+            shutil.rmtree(browser.profile_dir, ignore_errors=True)
+
+    def _launch(self, port: int) -> WarmBrowser:
+        profile_dir = tempfile.mkdtemp(prefix=f"oneflare-chrome-{port}-")
+        write_profile_prefs(profile_dir, BLOCKED_CONTENT_PREFS)
+        command: List[str] = [
+            self.chrome_binary,
+            f"--remote-debugging-port={port}",
+            f"--user-data-dir={profile_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            *CHROME_ARGUMENTS,
+        ]
+        if self.headless:
+            command.append("--headless=new")
+        command.append("about:blank")
+        process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return WarmBrowser(port=port, profile_dir=profile_dir, process=process)
+
+
+def write_profile_prefs(profile_dir: str, prefs: Dict[str, Any]) -> None:
+    """Seed a fresh profile's ``Default/Preferences`` the way chromedriver applies its ``prefs`` option."""
+    nested: Dict[str, Any] = {}
+    for key, value in prefs.items():
+        *parents, leaf = key.split(".")
+        node = nested
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[leaf] = value
+    os.makedirs(os.path.join(profile_dir, "Default"), exist_ok=True)
+    with open(os.path.join(profile_dir, "Default", "Preferences"), "w", encoding="utf-8") as handle:
+        json.dump(nested, handle)
+
+
+def make_handler(pool: DriverPool, acquire_timeout: float) -> type:
+    """Build a request handler bound to ``pool``."""
+
+    class PoolRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path == "/status":
+                self._reply(200, {"size": pool.size})
+            else:
+                self._reply(404, {"error": "unknown endpoint"})
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                payload = json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                self._reply(400, {"error": "invalid JSON body"})
+                return
+            if self.path == "/acquire":
+                address = pool.acquire(acquire_timeout)
+                if address is None:
+                    self._reply(503, {"error": "no idle browser"})
+                else:
+                    self._reply(200, {"address": address})
+            elif self.path == "/release":
+                if pool.release(str(payload.get("address", ""))):
+                    self._reply(200, {})
+                else:
+                    self._reply(400, {"error": "address is not leased"})
+            else:
+                self._reply(404, {"error": "unknown endpoint"})
+
+        def log_message(self, format: str, *args: object) -> None:
+            logging.debug("%s - %s", self.address_string(), format % args)
+
+        def _reply(self, status: int, body: Dict[str, object]) -> None:
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return PoolRequestHandler
+
+
+def find_chrome_binary() -> Optional[str]:
+    """Return the first Chrome/Chromium executable found on ``PATH``."""
+    for name in CHROME_BINARIES:
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments for the pool server."""
+    parser = argparse.ArgumentParser(description="Serve warm Chrome browsers to crawl_V3.py --driver-pool.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind the pool server to.")
+    parser.add_argument("--port", type=int, default=9250, help="Port for the pool server.")
+    parser.add_argument("--size", type=int, default=4, help="Number of browsers to keep warm.")
+    parser.add_argument("--base-port", type=int, default=9300, help="First DevTools port assigned to a browser.")
+    parser.add_argument("--chrome-binary", default=None, help="Chrome executable (defaults to the first one on PATH).")
+    parser.add_argument("--acquire-timeout", type=float, default=30.0, help="Seconds an /acquire call waits for an idle browser.")
+    parser.add_argument(
+        "--headless",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Run the pooled browsers headless.",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Enable debug logging.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Start the browsers and serve leases until interrupted."""
+    args = parse_args()
+    configure_logging(args.verbose)
+    chrome_binary = args.chrome_binary or find_chrome_binary()
+    if not chrome_binary:
+        raise SystemExit("No Chrome executable found; pass --chrome-binary.")
+
+    pool = DriverPool(args.size, chrome_binary, base_port=args.base_port, headless=args.headless)
+    pool.start()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(pool, args.acquire_timeout))
+    logging.info("Driver pool listening on http://%s:%d", args.host, args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logging.info("Shutting down driver pool.")
+    finally:
+        server.server_close()
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()